@@ -1,65 +1,100 @@
 #!/usr/bin/env python3
 """
 Analyze backtest CSV files to identify improvement opportunities
+
+Requires numpy and pandas >= 2.0 (for ISO8601 timestamp parsing):
+    pip install numpy 'pandas>=2.0'
 """
 
-import csv
 import sys
-from collections import defaultdict
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
+# Column types for the CSV written by RealisticBacktestEngine.exportCSV
+TRADE_DTYPES = {
+    'Ticker': 'category',
+    'Reason': 'category',
+    'Direction': 'category',
+    # Prices are only displayed to the cent, and float32 still rounds to the right cent
+    # below 2**17 (131072); P&L columns are summed into account totals and stay
+    # float64 so those totals keep their cents
+    'EntryPrice': 'float32',
+    'ExitPrice': 'float32',
+    'GrossPnL': 'float64',
+    'Commission': 'float64',
+    'NetPnL': 'float64',
+}
+
+# Upper bound on files parsed concurrently
+MAX_PARSE_WORKERS = 8
+
+CATEGORY_COLUMNS = [column for column, dtype in TRADE_DTYPES.items() if dtype == 'category']
+
+# Market timezone used by the bot (see config.GetLocation)
+MARKET_TZ = 'America/New_York'
+
+def parse_time(column):
+    """Parse RFC3339 timestamps and convert them to market time"""
+    # Offsets change across DST, so normalize through UTC before converting
+    return pd.to_datetime(column, utc=True, format='ISO8601').dt.tz_convert(MARKET_TZ)
+
 def parse_csv(filepath):
-    """Parse a backtest CSV file and return list of trades"""
-    trades = []
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if not row.get('Ticker'):  # Skip empty rows
-                continue
-            trade = {
-                'Ticker': row['Ticker'],
-                'EntryTime': datetime.fromisoformat(row['EntryTime'].replace('Z', '+00:00')),
-                'ExitTime': datetime.fromisoformat(row['ExitTime'].replace('Z', '+00:00')),
-                'EntryPrice': float(row['EntryPrice']),
-                'ExitPrice': float(row['ExitPrice']),
-                'Shares': int(row['Shares']),
-                'Reason': row['Reason'],
-                'GrossPnL': float(row['GrossPnL']),
-                'Commission': float(row['Commission']),
-                'NetPnL': float(row['NetPnL']),
-                'Direction': row.get('Direction', 'SHORT'),  # Default to SHORT if missing
-            }
-            trades.append(trade)
-    return trades
+    """Parse a backtest CSV file and return a DataFrame of trades"""
+    df = pd.read_csv(filepath, dtype=TRADE_DTYPES)
+    df = df.dropna(subset=['Ticker'])  # Skip empty rows
+    df['EntryTime'] = parse_time(df['EntryTime'])
+    df['ExitTime'] = parse_time(df['ExitTime'])
+    df['Shares'] = df['Shares'].astype('int32')
+    if df['Reason'].hasnans:
+        df['Reason'] = df['Reason'].cat.add_categories('').fillna('')
+    if 'Direction' not in df:
+        df['Direction'] = pd.Series('SHORT', index=df.index, dtype='category')  # Default to SHORT if missing
+    return df
+
+def concat_trades(frames):
+    """Concatenate trade DataFrames, unifying categories so the columns stay categorical"""
+    for column in CATEGORY_COLUMNS:
+        categories = frames[0][column].cat.categories
+        for frame in frames[1:]:
+            categories = categories.union(frame[column].cat.categories, sort=False)
+        for frame in frames:
+            frame[column] = frame[column].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+def sign_buckets(pnl):
+    """Count trades and total P&L for losing, flat and winning trades, in that order"""
+    signs = np.sign(pnl).astype(np.int8) + 1  # 0 = loss, 1 = flat, 2 = win
+    return np.bincount(signs, minlength=3).tolist(), np.bincount(signs, weights=pnl, minlength=3)
 
 def analyze_backtests(filepaths):
     """Analyze multiple backtest files"""
-    all_trades = []
     file_stats = {}
     
-    for filepath in filepaths:
-        trades = parse_csv(filepath)
-        all_trades.extend(trades)
+    # pandas' C parser releases the GIL, so files can be read in parallel
+    with ThreadPoolExecutor(max_workers=min(MAX_PARSE_WORKERS, len(filepaths))) as executor:
+        frames = list(executor.map(parse_csv, filepaths))
+    
+    for filepath, trades in zip(filepaths, frames):
+        pnl = trades['NetPnL'].to_numpy()
+        (losses, _, wins), (loss_pnl, _, win_pnl) = sign_buckets(pnl)
         
         # Calculate stats for this file
         total_trades = len(trades)
-        wins = sum(1 for t in trades if t['NetPnL'] > 0)
-        losses = sum(1 for t in trades if t['NetPnL'] < 0)
-        total_net_pnl = sum(t['NetPnL'] for t in trades)
-        total_gross_pnl = sum(t['GrossPnL'] for t in trades)
-        total_commission = sum(t['Commission'] for t in trades)
+        total_net_pnl = pnl.sum()
+        total_gross_pnl = trades['GrossPnL'].sum()
+        total_commission = trades['Commission'].sum()
         win_rate = (wins / total_trades * 100) if total_trades > 0 else 0
         
         # Calculate average win/loss
-        winning_trades = [t for t in trades if t['NetPnL'] > 0]
-        losing_trades = [t for t in trades if t['NetPnL'] < 0]
-        avg_win = sum(t['NetPnL'] for t in winning_trades) / len(winning_trades) if winning_trades else 0
-        avg_loss = sum(t['NetPnL'] for t in losing_trades) / len(losing_trades) if losing_trades else 0
+        avg_win = win_pnl / wins if wins else 0
+        avg_loss = loss_pnl / losses if losses else 0
         
         # Largest win/loss
-        largest_win = max((t['NetPnL'] for t in trades), default=0)
-        largest_loss = min((t['NetPnL'] for t in trades), default=0)
+        largest_win = pnl.max() if total_trades else 0
+        largest_loss = pnl.min() if total_trades else 0
         
         file_stats[filepath] = {
             'total_trades': total_trades,
@@ -73,12 +108,32 @@ def analyze_backtests(filepaths):
             'avg_loss': avg_loss,
             'largest_win': largest_win,
             'largest_loss': largest_loss,
-            'trades': trades,
         }
     
+    # Concatenate once instead of growing a combined list file by file
+    all_trades = concat_trades(frames)
     return all_trades, file_stats
 
-def print_analysis(file_stats):
+def group_pnl(keys, pnl):
+    """Aggregate trade count, total P&L and wins per key, most traded first"""
+    codes, uniques = pd.factorize(keys)
+    n = len(uniques)
+    stats = pd.DataFrame({
+        'count': np.bincount(codes, minlength=n),
+        'total_pnl': np.bincount(codes, weights=pnl, minlength=n),
+        'wins': np.bincount(codes, weights=pnl > 0, minlength=n).astype(np.int64),
+    }, index=uniques)
+    return stats.sort_values('count', ascending=False, kind='stable')
+
+def hour_pnl(times, pnl):
+    """Aggregate trade count and total P&L per hour of day, for hours with trades"""
+    hours = times.dt.hour.to_numpy()
+    counts = np.bincount(hours, minlength=24)
+    totals = np.bincount(hours, weights=pnl, minlength=24)
+    traded = np.flatnonzero(counts)
+    return pd.DataFrame({'count': counts[traded], 'total_pnl': totals[traded]}, index=traded)
+
+def print_analysis(all_trades):
     """Print comprehensive analysis"""
     print("=" * 80)
     print("BACKTEST ANALYSIS - IMPROVEMENT OPPORTUNITIES")
@@ -88,21 +143,16 @@ def print_analysis(file_stats):
     # Overall statistics
     print("OVERALL STATISTICS")
     print("-" * 80)
-    all_trades = []
-    for stats in file_stats.values():
-        all_trades.extend(stats['trades'])
+    pnl = all_trades['NetPnL'].to_numpy()
+    (losses, _, wins), (loss_pnl, _, win_pnl) = sign_buckets(pnl)
     
     total_trades = len(all_trades)
-    wins = sum(1 for t in all_trades if t['NetPnL'] > 0)
-    losses = sum(1 for t in all_trades if t['NetPnL'] < 0)
-    total_net_pnl = sum(t['NetPnL'] for t in all_trades)
-    total_commission = sum(t['Commission'] for t in all_trades)
+    total_net_pnl = pnl.sum()
+    total_commission = all_trades['Commission'].sum()
     win_rate = (wins / total_trades * 100) if total_trades > 0 else 0
     
-    winning_trades = [t for t in all_trades if t['NetPnL'] > 0]
-    losing_trades = [t for t in all_trades if t['NetPnL'] < 0]
-    avg_win = sum(t['NetPnL'] for t in winning_trades) / len(winning_trades) if winning_trades else 0
-    avg_loss = sum(t['NetPnL'] for t in losing_trades) / len(losing_trades) if losing_trades else 0
+    avg_win = win_pnl / wins if wins else 0
+    avg_loss = loss_pnl / losses if losses else 0
     
     print(f"Total Trades: {total_trades}")
     print(f"Wins: {wins} ({win_rate:.1f}%)")
@@ -117,67 +167,67 @@ def print_analysis(file_stats):
     # Exit reason analysis
     print("EXIT REASON ANALYSIS")
     print("-" * 80)
-    exit_reasons = defaultdict(lambda: {'count': 0, 'total_pnl': 0, 'wins': 0, 'losses': 0})
-    for trade in all_trades:
-        reason = trade['Reason']
-        exit_reasons[reason]['count'] += 1
-        exit_reasons[reason]['total_pnl'] += trade['NetPnL']
-        if trade['NetPnL'] > 0:
-            exit_reasons[reason]['wins'] += 1
-        else:
-            exit_reasons[reason]['losses'] += 1
-    
-    for reason, stats in sorted(exit_reasons.items(), key=lambda x: x[1]['count'], reverse=True):
-        win_rate = (stats['wins'] / stats['count'] * 100) if stats['count'] > 0 else 0
-        avg_pnl = stats['total_pnl'] / stats['count'] if stats['count'] > 0 else 0
-        print(f"{reason:20s}: {stats['count']:3d} trades | "
-              f"Win Rate: {win_rate:5.1f}% | "
-              f"Total P&L: ${stats['total_pnl']:8.2f} | "
+    exit_reasons = group_pnl(all_trades['Reason'], pnl)
+    exit_reasons['losses'] = exit_reasons['count'] - exit_reasons['wins']
+    
+    for reason, count, total_pnl, wins, losses in exit_reasons.itertuples():
+        group_win_rate = (wins / count * 100) if count > 0 else 0
+        avg_pnl = total_pnl / count if count > 0 else 0
+        print(f"{reason:20s}: {count:3d} trades | "
+              f"Win Rate: {group_win_rate:5.1f}% | "
+              f"Total P&L: ${total_pnl:8.2f} | "
               f"Avg P&L: ${avg_pnl:7.2f}")
     print()
     
+    # Exit reason categories
+    reason = all_trades['Reason']
+    eod_pnl_arr = pnl[reason.eq('End of Day').to_numpy()]
+    sl_pnl_arr = pnl[reason.str.contains('Stop Loss', regex=False).to_numpy()]
+    ts_pnl_arr = pnl[reason.str.contains('Trailing Stop', regex=False).to_numpy()]
+    tgt_pnl_arr = pnl[reason.str.contains('Target', regex=False).to_numpy()]
+    
     # End of Day analysis
-    eod_trades = [t for t in all_trades if t['Reason'] == 'End of Day']
-    if eod_trades:
+    eod_count = eod_pnl_arr.size
+    if eod_count:
         print("END OF DAY EXITS - IMPROVEMENT OPPORTUNITY")
         print("-" * 80)
-        eod_pnl = sum(t['NetPnL'] for t in eod_trades)
-        eod_wins = sum(1 for t in eod_trades if t['NetPnL'] > 0)
-        eod_win_rate = (eod_wins / len(eod_trades) * 100) if eod_trades else 0
-        print(f"EOD Trades: {len(eod_trades)} ({len(eod_trades)/total_trades*100:.1f}% of all trades)")
+        eod_pnl = eod_pnl_arr.sum()
+        eod_wins = int((eod_pnl_arr > 0).sum())
+        eod_win_rate = eod_wins / eod_count * 100
+        print(f"EOD Trades: {eod_count} ({eod_count/total_trades*100:.1f}% of all trades)")
         print(f"EOD Total P&L: ${eod_pnl:,.2f}")
         print(f"EOD Win Rate: {eod_win_rate:.1f}%")
-        print(f"⚠️  ISSUE: {len(eod_trades)} trades closed at EOD - consider earlier exits or holding overnight")
+        print(f"⚠️  ISSUE: {eod_count} trades closed at EOD - consider earlier exits or holding overnight")
         print()
     
     # Stop Loss analysis
-    stop_loss_trades = [t for t in all_trades if 'Stop Loss' in t['Reason']]
-    if stop_loss_trades:
+    sl_count = sl_pnl_arr.size
+    if sl_count:
         print("STOP LOSS ANALYSIS")
         print("-" * 80)
-        sl_pnl = sum(t['NetPnL'] for t in stop_loss_trades)
-        sl_avg_loss = sum(t['NetPnL'] for t in stop_loss_trades) / len(stop_loss_trades) if stop_loss_trades else 0
-        largest_sl = min((t['NetPnL'] for t in stop_loss_trades), default=0)
-        print(f"Stop Loss Trades: {len(stop_loss_trades)}")
+        sl_pnl = sl_pnl_arr.sum()
+        sl_avg_loss = sl_pnl / sl_count
+        largest_sl = sl_pnl_arr.min()
+        print(f"Stop Loss Trades: {sl_count}")
         print(f"Total P&L from Stops: ${sl_pnl:,.2f}")
         print(f"Average Loss: ${sl_avg_loss:.2f}")
         print(f"Largest Stop Loss: ${largest_sl:.2f}")
         
         # Find problematic stop losses
-        large_stops = [t for t in stop_loss_trades if t['NetPnL'] < -100]
+        large_stops = int((sl_pnl_arr < -100).sum())
         if large_stops:
-            print(f"⚠️  ISSUE: {len(large_stops)} stop losses > $100")
+            print(f"⚠️  ISSUE: {large_stops} stop losses > $100")
             print("   Consider: Tighter stops, better entry timing, or position sizing")
         print()
     
     # Trailing Stop analysis
-    trailing_stop_trades = [t for t in all_trades if 'Trailing Stop' in t['Reason']]
-    if trailing_stop_trades:
+    ts_count = ts_pnl_arr.size
+    if ts_count:
         print("TRAILING STOP ANALYSIS")
         print("-" * 80)
-        ts_pnl = sum(t['NetPnL'] for t in trailing_stop_trades)
-        ts_win_rate = (sum(1 for t in trailing_stop_trades if t['NetPnL'] > 0) / len(trailing_stop_trades) * 100) if trailing_stop_trades else 0
-        print(f"Trailing Stop Trades: {len(trailing_stop_trades)}")
+        ts_pnl = ts_pnl_arr.sum()
+        ts_win_rate = (ts_pnl_arr > 0).sum() / ts_count * 100
+        print(f"Trailing Stop Trades: {ts_count}")
         print(f"Total P&L: ${ts_pnl:,.2f}")
         print(f"Win Rate: {ts_win_rate:.1f}%")
         if ts_pnl < 0:
@@ -185,13 +235,13 @@ def print_analysis(file_stats):
         print()
     
     # Target analysis
-    target_trades = [t for t in all_trades if 'Target' in t['Reason']]
-    if target_trades:
+    tgt_count = tgt_pnl_arr.size
+    if tgt_count:
         print("TARGET EXITS ANALYSIS")
         print("-" * 80)
-        target_pnl = sum(t['NetPnL'] for t in target_trades)
-        target_win_rate = (sum(1 for t in target_trades if t['NetPnL'] > 0) / len(target_trades) * 100) if target_trades else 0
-        print(f"Target Exits: {len(target_trades)} ({len(target_trades)/total_trades*100:.1f}% of all trades)")
+        target_pnl = tgt_pnl_arr.sum()
+        target_win_rate = (tgt_pnl_arr > 0).sum() / tgt_count * 100
+        print(f"Target Exits: {tgt_count} ({tgt_count/total_trades*100:.1f}% of all trades)")
         print(f"Total P&L: ${target_pnl:,.2f}")
         print(f"Win Rate: {target_win_rate:.1f}%")
         print(f"✓ Target exits are working well")
@@ -210,88 +260,63 @@ def print_analysis(file_stats):
     # Time-based patterns
     print("TIME-BASED PATTERNS")
     print("-" * 80)
-    entry_hours = defaultdict(lambda: {'count': 0, 'total_pnl': 0})
-    exit_hours = defaultdict(lambda: {'count': 0, 'total_pnl': 0})
-    
-    for trade in all_trades:
-        entry_hour = trade['EntryTime'].hour
-        exit_hour = trade['ExitTime'].hour
-        entry_hours[entry_hour]['count'] += 1
-        entry_hours[entry_hour]['total_pnl'] += trade['NetPnL']
-        exit_hours[exit_hour]['count'] += 1
-        exit_hours[exit_hour]['total_pnl'] += trade['NetPnL']
+    entry_hours = hour_pnl(all_trades['EntryTime'], pnl)
     
     print("Entry Hour Performance:")
-    for hour in sorted(entry_hours.keys()):
-        stats = entry_hours[hour]
-        avg_pnl = stats['total_pnl'] / stats['count'] if stats['count'] > 0 else 0
-        print(f"  {hour:2d}:00 - {stats['count']:3d} trades, Avg P&L: ${avg_pnl:7.2f}, Total: ${stats['total_pnl']:8.2f}")
+    for hour, count, total_pnl in entry_hours.itertuples():
+        avg_pnl = total_pnl / count if count > 0 else 0
+        print(f"  {hour:2d}:00 - {count:3d} trades, Avg P&L: ${avg_pnl:7.2f}, Total: ${total_pnl:8.2f}")
     print()
     
     # Ticker performance
     print("TICKER PERFORMANCE (Top 10 by trade count)")
     print("-" * 80)
-    ticker_stats = defaultdict(lambda: {'count': 0, 'total_pnl': 0, 'wins': 0})
-    for trade in all_trades:
-        ticker = trade['Ticker']
-        ticker_stats[ticker]['count'] += 1
-        ticker_stats[ticker]['total_pnl'] += trade['NetPnL']
-        if trade['NetPnL'] > 0:
-            ticker_stats[ticker]['wins'] += 1
-    
-    sorted_tickers = sorted(ticker_stats.items(), key=lambda x: x[1]['count'], reverse=True)[:10]
-    for ticker, stats in sorted_tickers:
-        win_rate = (stats['wins'] / stats['count'] * 100) if stats['count'] > 0 else 0
-        avg_pnl = stats['total_pnl'] / stats['count'] if stats['count'] > 0 else 0
-        print(f"{ticker:6s}: {stats['count']:3d} trades | "
-              f"Win Rate: {win_rate:5.1f}% | "
-              f"Total P&L: ${stats['total_pnl']:8.2f} | "
+    ticker_stats = group_pnl(all_trades['Ticker'], pnl)
+    
+    for ticker, count, total_pnl, wins in ticker_stats.head(10).itertuples():
+        group_win_rate = (wins / count * 100) if count > 0 else 0
+        avg_pnl = total_pnl / count if count > 0 else 0
+        print(f"{ticker:6s}: {count:3d} trades | "
+              f"Win Rate: {group_win_rate:5.1f}% | "
+              f"Total P&L: ${total_pnl:8.2f} | "
               f"Avg P&L: ${avg_pnl:7.2f}")
     print()
     
     # Large losses
     print("LARGEST LOSSES (Top 10)")
     print("-" * 80)
-    sorted_losses = sorted([t for t in all_trades if t['NetPnL'] < 0], key=lambda x: x['NetPnL'])[:10]
-    for trade in sorted_losses:
-        print(f"{trade['Ticker']:6s} | {trade['Reason']:20s} | "
-              f"Entry: ${trade['EntryPrice']:7.2f} | Exit: ${trade['ExitPrice']:7.2f} | "
-              f"P&L: ${trade['NetPnL']:8.2f} | Shares: {trade['Shares']:4d}")
+    top_losses = all_trades.nsmallest(10, 'NetPnL')
+    for trade in top_losses[top_losses['NetPnL'] < 0].itertuples(index=False):
+        print(f"{trade.Ticker:6s} | {trade.Reason:20s} | "
+              f"Entry: ${trade.EntryPrice:7.2f} | Exit: ${trade.ExitPrice:7.2f} | "
+              f"P&L: ${trade.NetPnL:8.2f} | Shares: {trade.Shares:4d}")
     print()
     
     # Large wins
     print("LARGEST WINS (Top 10)")
     print("-" * 80)
-    sorted_wins = sorted([t for t in all_trades if t['NetPnL'] > 0], key=lambda x: x['NetPnL'], reverse=True)[:10]
-    for trade in sorted_wins:
-        print(f"{trade['Ticker']:6s} | {trade['Reason']:20s} | "
-              f"Entry: ${trade['EntryPrice']:7.2f} | Exit: ${trade['ExitPrice']:7.2f} | "
-              f"P&L: ${trade['NetPnL']:8.2f} | Shares: {trade['Shares']:4d}")
+    top_wins = all_trades.nlargest(10, 'NetPnL')
+    for trade in top_wins[top_wins['NetPnL'] > 0].itertuples(index=False):
+        print(f"{trade.Ticker:6s} | {trade.Reason:20s} | "
+              f"Entry: ${trade.EntryPrice:7.2f} | Exit: ${trade.ExitPrice:7.2f} | "
+              f"P&L: ${trade.NetPnL:8.2f} | Shares: {trade.Shares:4d}")
     print()
     
     # Trade duration analysis
     print("TRADE DURATION ANALYSIS")
     print("-" * 80)
-    durations = []
-    for trade in all_trades:
-        duration = (trade['ExitTime'] - trade['EntryTime']).total_seconds() / 60  # minutes
-        durations.append((duration, trade))
-    
-    durations.sort(key=lambda x: x[0])
-    avg_duration = sum(d[0] for d in durations) / len(durations) if durations else 0
+    durations = (all_trades['ExitTime'] - all_trades['EntryTime']).dt.total_seconds().to_numpy() / 60  # minutes
+    avg_duration = durations.mean() if durations.size else 0
     
-    # Analyze by duration buckets
-    short_trades = [d for d in durations if d[0] < 30]  # < 30 min
-    medium_trades = [d for d in durations if 30 <= d[0] < 120]  # 30 min - 2 hours
-    long_trades = [d for d in durations if d[0] >= 120]  # >= 2 hours
+    # Analyze by duration buckets: < 30 min, 30 min - 2 hours, >= 2 hours
+    buckets = np.digitize(durations, [30, 120])
+    bucket_counts = np.bincount(buckets, minlength=3)
+    bucket_pnl = np.bincount(buckets, weights=pnl, minlength=3)
     
     print(f"Average Duration: {avg_duration:.1f} minutes")
-    print(f"Short trades (<30min): {len(short_trades)} trades, "
-          f"Avg P&L: ${sum(t[1]['NetPnL'] for t in short_trades)/len(short_trades):.2f}" if short_trades else "0 trades")
-    print(f"Medium trades (30min-2hr): {len(medium_trades)} trades, "
-          f"Avg P&L: ${sum(t[1]['NetPnL'] for t in medium_trades)/len(medium_trades):.2f}" if medium_trades else "0 trades")
-    print(f"Long trades (>=2hr): {len(long_trades)} trades, "
-          f"Avg P&L: ${sum(t[1]['NetPnL'] for t in long_trades)/len(long_trades):.2f}" if long_trades else "0 trades")
+    labels = ["Short trades (<30min)", "Medium trades (30min-2hr)", "Long trades (>=2hr)"]
+    for label, count, total_pnl in zip(labels, bucket_counts, bucket_pnl):
+        print(f"{label}: {count} trades, Avg P&L: ${total_pnl/count:.2f}" if count else "0 trades")
     print()
     
     # Summary of improvements
@@ -300,15 +325,15 @@ def print_analysis(file_stats):
     print("=" * 80)
     improvements = []
     
-    if eod_trades and len(eod_trades) > total_trades * 0.2:
-        improvements.append(f"1. EOD EXITS: {len(eod_trades)} trades ({len(eod_trades)/total_trades*100:.1f}%) closed at EOD")
+    if eod_count and eod_count > total_trades * 0.2:
+        improvements.append(f"1. EOD EXITS: {eod_count} trades ({eod_count/total_trades*100:.1f}%) closed at EOD")
         improvements.append("   → Consider: Earlier exit signals, holding overnight for winners, or tighter EOD rules")
     
-    if stop_loss_trades and sl_avg_loss < -50:
+    if sl_count and sl_avg_loss < -50:
         improvements.append(f"2. STOP LOSSES: Average loss ${sl_avg_loss:.2f} is large")
         improvements.append("   → Consider: Tighter stops, better entry timing, or position sizing adjustments")
     
-    if trailing_stop_trades and sum(t['NetPnL'] for t in trailing_stop_trades) < 0:
+    if ts_count and ts_pnl < 0:
         improvements.append("3. TRAILING STOPS: Currently losing money")
         improvements.append("   → Consider: Adjusting trailing stop distance or activation threshold")
     
@@ -336,7 +361,7 @@ if __name__ == '__main__':
         print("Usage: python analyze_backtests.py <csv_file1> [csv_file2] ...")
         sys.exit(1)
     
-    filepaths = sys.argv[1:]
+    filepaths = list(dict.fromkeys(sys.argv[1:]))  # Count a file passed twice only once
     all_trades, file_stats = analyze_backtests(filepaths)
-    print_analysis(file_stats)
+    print_analysis(all_trades)
 
@@ -1,86 +1,126 @@
 #!/usr/bin/env python3
 """
 Compare new backtest results with previous results to evaluate fixes
+
+Requires numpy and pandas >= 2.0 (for ISO8601 timestamp parsing):
+    pip install numpy 'pandas>=2.0'
 """
 
-import csv
 import sys
-from collections import defaultdict
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# Column types for the CSV written by RealisticBacktestEngine.exportCSV
+TRADE_DTYPES = {
+    'Ticker': 'category',
+    'Reason': 'category',
+    'Direction': 'category',
+    # Prices are never read here, so float32 only halves their memory; P&L columns
+    # are summed and stay float64
+    'EntryPrice': 'float32',
+    'ExitPrice': 'float32',
+    'GrossPnL': 'float64',
+    'Commission': 'float64',
+    'NetPnL': 'float64',
+}
+
+# Upper bound on files parsed concurrently
+MAX_PARSE_WORKERS = 8
+
+CATEGORY_COLUMNS = [column for column, dtype in TRADE_DTYPES.items() if dtype == 'category']
+
+# Per exit reason aggregates, one fixed-size record per reason
+EXIT_STATS_DTYPE = np.dtype([('count', 'i8'), ('total_pnl', 'f8'), ('wins', 'i8')])
+
+# Market timezone used by the bot (see config.GetLocation)
+MARKET_TZ = 'America/New_York'
+
+def parse_time(column):
+    """Parse RFC3339 timestamps and convert them to market time"""
+    # Offsets change across DST, so normalize through UTC before converting
+    return pd.to_datetime(column, utc=True, format='ISO8601').dt.tz_convert(MARKET_TZ)
 
 def parse_csv(filepath):
-    """Parse a backtest CSV file and return list of trades"""
-    trades = []
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if not row.get('Ticker'):
-                continue
-            trade = {
-                'Ticker': row['Ticker'],
-                'EntryTime': datetime.fromisoformat(row['EntryTime'].replace('Z', '+00:00')),
-                'ExitTime': datetime.fromisoformat(row['ExitTime'].replace('Z', '+00:00')),
-                'EntryPrice': float(row['EntryPrice']),
-                'ExitPrice': float(row['ExitPrice']),
-                'Shares': int(row['Shares']),
-                'Reason': row['Reason'],
-                'GrossPnL': float(row['GrossPnL']),
-                'Commission': float(row['Commission']),
-                'NetPnL': float(row['NetPnL']),
-                'Direction': row.get('Direction', 'SHORT'),
-            }
-            trades.append(trade)
-    return trades
+    """Parse a backtest CSV file and return a DataFrame of trades"""
+    df = pd.read_csv(filepath, dtype=TRADE_DTYPES)
+    df = df.dropna(subset=['Ticker'])
+    df['EntryTime'] = parse_time(df['EntryTime'])
+    df['ExitTime'] = parse_time(df['ExitTime'])
+    df['Shares'] = df['Shares'].astype('int32')
+    if df['Reason'].hasnans:
+        df['Reason'] = df['Reason'].cat.add_categories('').fillna('')
+    if 'Direction' not in df:
+        df['Direction'] = pd.Series('SHORT', index=df.index, dtype='category')
+    return df
+
+def concat_trades(frames):
+    """Concatenate trade DataFrames, unifying categories so the columns stay categorical"""
+    for column in CATEGORY_COLUMNS:
+        categories = frames[0][column].cat.categories
+        for frame in frames[1:]:
+            categories = categories.union(frame[column].cat.categories, sort=False)
+        for frame in frames:
+            frame[column] = frame[column].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+def sign_buckets(pnl):
+    """Count trades and total P&L for losing, flat and winning trades, in that order"""
+    signs = np.sign(pnl).astype(np.int8) + 1  # 0 = loss, 1 = flat, 2 = win
+    return np.bincount(signs, minlength=3).tolist(), np.bincount(signs, weights=pnl, minlength=3)
 
 def analyze_file(filepath):
     """Analyze a single backtest file"""
     trades = parse_csv(filepath)
+    pnl = trades['NetPnL'].to_numpy()
+    is_win = pnl > 0
     
     total_trades = len(trades)
-    wins = sum(1 for t in trades if t['NetPnL'] > 0)
-    losses = sum(1 for t in trades if t['NetPnL'] < 0)
-    total_net_pnl = sum(t['NetPnL'] for t in trades)
+    (losses, _, wins), _ = sign_buckets(pnl)
+    total_net_pnl = pnl.sum()
     win_rate = (wins / total_trades * 100) if total_trades > 0 else 0
     
     # Exit reason breakdown
-    exit_reasons = defaultdict(lambda: {'count': 0, 'total_pnl': 0, 'wins': 0})
-    for trade in trades:
-        reason = trade['Reason']
-        exit_reasons[reason]['count'] += 1
-        exit_reasons[reason]['total_pnl'] += trade['NetPnL']
-        if trade['NetPnL'] > 0:
-            exit_reasons[reason]['wins'] += 1
+    codes, reasons = pd.factorize(trades['Reason'])
+    exit_stats = np.zeros(len(reasons), dtype=EXIT_STATS_DTYPE)
+    exit_stats['count'] = np.bincount(codes, minlength=len(reasons))
+    exit_stats['total_pnl'] = np.bincount(codes, weights=pnl, minlength=len(reasons))
+    exit_stats['wins'] = np.bincount(codes, weights=is_win, minlength=len(reasons))
+    order = np.argsort(-exit_stats['count'], kind='stable')  # Most common first
     
     # EOD exits
-    eod_trades = [t for t in trades if t['Reason'] == 'End of Day']
-    eod_pnl = sum(t['NetPnL'] for t in eod_trades)
+    eod_mask = (trades['Reason'] == 'End of Day').to_numpy()
+    eod_pnl = pnl[eod_mask].sum()
     
     # Time Decay exits (early exits)
-    time_decay_trades = [t for t in trades if t['Reason'] == 'Time Decay']
-    time_decay_pnl = sum(t['NetPnL'] for t in time_decay_trades)
+    time_decay_mask = (trades['Reason'] == 'Time Decay').to_numpy()
+    time_decay_pnl = pnl[time_decay_mask].sum()
     
     # Entry times
-    entry_hours = defaultdict(int)
-    for trade in trades:
-        entry_hours[trade['EntryTime'].hour] += 1
+    entry_hour = trades['EntryTime'].dt.hour.to_numpy()
+    hour_counts = np.bincount(entry_hour, minlength=24)
     
     # Afternoon entries (after 2 PM)
-    afternoon_entries = [t for t in trades if t['EntryTime'].hour >= 14]
+    afternoon_entries = int((entry_hour >= 14).sum())
     
     return {
         'filepath': filepath,
+        'trades_df': trades,
         'total_trades': total_trades,
         'wins': wins,
         'losses': losses,
         'win_rate': win_rate,
         'total_net_pnl': total_net_pnl,
-        'exit_reasons': dict(exit_reasons),
-        'eod_trades': len(eod_trades),
+        'exit_reasons': reasons[order].tolist(),
+        'exit_stats': exit_stats[order],
+        'eod_trades': int(eod_mask.sum()),
+        'eod_wins': int((eod_mask & is_win).sum()),
         'eod_pnl': eod_pnl,
-        'time_decay_trades': len(time_decay_trades),
+        'time_decay_trades': int(time_decay_mask.sum()),
         'time_decay_pnl': time_decay_pnl,
-        'afternoon_entries': len(afternoon_entries),
-        'entry_hours': dict(entry_hours),
+        'afternoon_entries': afternoon_entries,
+        'entry_hours': {hour: int(count) for hour, count in enumerate(hour_counts) if count},
     }
 
 if __name__ == '__main__':
@@ -89,17 +129,17 @@ if __name__ == '__main__':
         sys.exit(1)
     
     filepaths = sys.argv[1:]
-    results = []
+    
+    # pandas' C parser releases the GIL, so files can be read in parallel
+    with ThreadPoolExecutor(max_workers=min(MAX_PARSE_WORKERS, len(filepaths))) as executor:
+        results = list(executor.map(analyze_file, filepaths))
     
     print("=" * 80)
     print("NEW BACKTEST RESULTS ANALYSIS (After Fixes)")
     print("=" * 80)
     print()
     
-    for filepath in filepaths:
-        result = analyze_file(filepath)
-        results.append(result)
-        
+    for filepath, result in zip(filepaths, results):
         print(f"File: {filepath.split('/')[-1]}")
         print("-" * 80)
         print(f"Total Trades: {result['total_trades']}")
@@ -108,7 +148,7 @@ if __name__ == '__main__':
         print()
         
         print("Exit Reasons:")
-        for reason, stats in sorted(result['exit_reasons'].items(), key=lambda x: x[1]['count'], reverse=True):
+        for reason, stats in zip(result['exit_reasons'], result['exit_stats']):
             win_rate = (stats['wins'] / stats['count'] * 100) if stats['count'] > 0 else 0
             avg_pnl = stats['total_pnl'] / stats['count'] if stats['count'] > 0 else 0
             print(f"  {reason:20s}: {stats['count']:2d} trades | "
@@ -120,7 +160,7 @@ if __name__ == '__main__':
         print("Fix Evaluation:")
         print(f"  EOD Exits: {result['eod_trades']} trades, Total P&L: ${result['eod_pnl']:.2f}")
         if result['eod_trades'] > 0:
-            eod_win_rate = sum(1 for t in parse_csv(filepath) if t['Reason'] == 'End of Day' and t['NetPnL'] > 0) / result['eod_trades'] * 100
+            eod_win_rate = result['eod_wins'] / result['eod_trades'] * 100
             print(f"    EOD Win Rate: {eod_win_rate:.1f}%")
         
         print(f"  Time Decay Exits (Early Exits): {result['time_decay_trades']} trades, Total P&L: ${result['time_decay_pnl']:.2f}")
@@ -160,8 +200,8 @@ if __name__ == '__main__':
     print(f"   - EOD Exits: {total_eod} trades (down from 23 in previous)")
     print(f"   - EOD Total P&L: ${total_eod_pnl:.2f} (was -$435.69)")
     if total_eod > 0:
-        eod_win_rate = (sum(1 for r in results for t in parse_csv(r['filepath']) 
-                           if t['Reason'] == 'End of Day' and t['NetPnL'] > 0) / total_eod * 100) if total_eod > 0 else 0
+        eod_wins = sum(r['eod_wins'] for r in results)
+        eod_win_rate = (eod_wins / total_eod * 100) if total_eod > 0 else 0
         print(f"   - EOD Win Rate: {eod_win_rate:.1f}% (was 0%)")
     
     print(f"2. Time Decay (Early Exit) Fix:")
@@ -182,14 +222,12 @@ if __name__ == '__main__':
     print()
     
     # Check for trailing stops
-    all_trades = []
-    for r in results:
-        all_trades.extend(parse_csv(r['filepath']))
+    all_trades = concat_trades([r['trades_df'] for r in results])
     
-    trailing_stop_trades = [t for t in all_trades if 'Trailing Stop' in t['Reason']]
-    if trailing_stop_trades:
+    trailing_stop_trades = all_trades[all_trades['Reason'].str.contains('Trailing Stop', regex=False)]
+    if len(trailing_stop_trades):
         print(f"4. Trailing Stop Fix:")
-        trailing_pnl = sum(t['NetPnL'] for t in trailing_stop_trades)
+        trailing_pnl = trailing_stop_trades['NetPnL'].sum()
         print(f"   - Trailing Stop Trades: {len(trailing_stop_trades)}")
         print(f"   - Trailing Stop Total P&L: ${trailing_pnl:.2f}")
     else: